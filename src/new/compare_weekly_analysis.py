@@ -15,6 +15,8 @@ import sys
 from pathlib import Path
 from datetime import datetime
 from collections import defaultdict
+import heapq
+import io
 import statistics
 
 # Add project root to path
@@ -168,9 +170,9 @@ def identify_top_changes(zone_trends, n=3):
     """Identify top N improving/degrading zones"""
     deltas = [(zone, trend['overall']['delta']) for zone, trend in zone_trends.items()]
 
-    # Sort by delta (lower is better for errors)
-    improving = sorted(deltas, key=lambda x: x[1])[:n]
-    degrading = sorted(deltas, key=lambda x: x[1], reverse=True)[:n]
+    # Partial selection by delta (lower is better for errors)
+    improving = heapq.nsmallest(n, deltas, key=lambda x: x[1])
+    degrading = heapq.nlargest(n, deltas, key=lambda x: x[1])
 
     return {'improving': improving, 'degrading': degrading}
 
@@ -182,35 +184,49 @@ def format_number(n):
     return f"{n:,}"
 
 
-def generate_comparison_report(week1_metrics, week2_metrics, week3_metrics, outlier_stats, trends):
-    """Generate comprehensive comparison markdown report"""
-    sections = []
+def generate_comparison_report(week1_metrics, week2_metrics, week3_metrics, outlier_stats, trends, sink=None):
+    """
+    Generate comprehensive comparison markdown report
+
+    Each section is written to ``sink`` (any object with a ``write`` method, e.g. an
+    open file or ``io.StringIO``) as soon as it is built, so the full report never
+    has to exist as one string. Without a sink the report is returned as a string.
+    """
+    if sink is None:
+        buffer = io.StringIO()
+        generate_comparison_report(week1_metrics, week2_metrics, week3_metrics, outlier_stats, trends, sink=buffer)
+        return buffer.getvalue()
 
     # Header
-    sections.append("# 주간 예측 성능 비교 분석 (3주 트렌드)\n")
-    sections.append("**비교 기간:**")
-    sections.append("- Week 1: 2025-12-07 ~ 2025-12-13")
-    sections.append("- Week 2: 2025-12-14 ~ 2025-12-20")
-    sections.append("- Week 3: 2025-12-21 ~ 2025-12-27\n")
-    sections.append(f"생성일시: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-    sections.append("---\n")
+    sink.write('\n'.join([
+        "# 주간 예측 성능 비교 분석 (3주 트렌드)\n",
+        "**비교 기간:**",
+        "- Week 1: 2025-12-07 ~ 2025-12-13",
+        "- Week 2: 2025-12-14 ~ 2025-12-20",
+        "- Week 3: 2025-12-21 ~ 2025-12-27\n",
+        f"생성일시: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n",
+        "---\n",
+    ]))
 
     # Section 1: Data Quality Trends
-    sections.append(generate_data_quality_section(outlier_stats, week1_metrics, week2_metrics, week3_metrics))
+    sink.write('\n')
+    sink.write(generate_data_quality_section(outlier_stats, week1_metrics, week2_metrics, week3_metrics))
 
     # Section 2: Zone Performance Trends
-    sections.append(generate_zone_performance_section(trends, week1_metrics, week2_metrics, week3_metrics))
+    sink.write('\n')
+    sink.write(generate_zone_performance_section(trends, week1_metrics, week2_metrics, week3_metrics))
 
     # Section 3: Congestion Analysis
-    sections.append(generate_congestion_section(trends))
+    sink.write('\n')
+    sink.write(generate_congestion_section(trends))
 
     # Section 4: Average Wait Time Trends
-    sections.append(generate_wait_time_section(week1_metrics, week2_metrics, week3_metrics))
+    sink.write('\n')
+    sink.write(generate_wait_time_section(week1_metrics, week2_metrics, week3_metrics))
 
     # Section 5: Summary and Recommendations
-    sections.append(generate_summary_section(trends, outlier_stats))
-
-    return '\n'.join(sections)
+    sink.write('\n')
+    sink.write(generate_summary_section(trends, outlier_stats))
 
 
 def generate_record_trend_table(outlier_stats):
@@ -325,15 +341,14 @@ def generate_zone_error_table(zone_trends):
     md.append("|------|--------|--------|--------|-------|-------|-----------|--------|")
 
     for zone in sorted(zone_trends.keys()):
-        zone_name = ZONE_NAMES.get(zone, f'구역 {zone}')
         trend = zone_trends[zone]
-
         w1, w2, w3 = trend['values']
 
-        # Skip if all zeros
-        if w1 == 0 and w2 == 0 and w3 == 0:
+        # Skip if all zeros - before any name lookup or formatting
+        if not (w1 or w2 or w3):
             continue
 
+        zone_name = ZONE_NAMES.get(zone, f'구역 {zone}')
         md.append(f"| {zone_name} | "
                   f"{w1:+.2f}분 | {w2:+.2f}분 | {w3:+.2f}분 | "
                   f"{trend['w1_to_w2']['delta']:+.2f} | "
@@ -595,17 +610,14 @@ def main():
     print("Analyzing trends...")
     trends = calculate_all_trends(week1_metrics, week2_metrics, week3_metrics)
 
-    # Generate comparison report
+    # Generate comparison report, streaming sections straight to the output file
     print("Generating comparison report...")
-    report = generate_comparison_report(week1_metrics, week2_metrics, week3_metrics, outlier_stats, trends)
-
-    # Write output
     result_dir = project_root / 'resource' / 'result'
     result_dir.mkdir(exist_ok=True)
     output_path = result_dir / '주간_비교분석_3주_트렌드.md'
 
     with open(output_path, 'w', encoding='utf-8') as f:
-        f.write(report)
+        generate_comparison_report(week1_metrics, week2_metrics, week3_metrics, outlier_stats, trends, sink=f)
 
     print(f"\nComparison report generated: {output_path}")
 
@@ -1,6 +1,6 @@
 """Core analysis and data processing modules"""
 
 from .analysis_engine import analyze_logs
-from .data_loader import load_all_logs, filter_outliers
+from .data_loader import iter_logs, load_all_logs, filter_outliers
 
-__all__ = ['analyze_logs', 'load_all_logs', 'filter_outliers']
+__all__ = ['analyze_logs', 'iter_logs', 'load_all_logs', 'filter_outliers']
@@ -2,6 +2,7 @@
 """분석 엔진 모듈 - Analysis engine for queue prediction performance"""
 
 import math
+from bisect import bisect_left
 from datetime import datetime
 from collections import defaultdict
 from ..utils.statistics_utils import calculate_statistics
@@ -29,19 +30,14 @@ def _create_error_metrics(lidar_err, throughput_err, final_err, actual_pass_time
     }
 
 
+# Inclusive upper edges of the 10-person object-count bins and their labels (the last bin is open-ended).
+# Finer than the congestion-level edges in utils.congestion_utils, which bin into Low..Very High
+_OBJECT_COUNT_EDGES = (10, 20, 30, 40, 50)
+_OBJECT_COUNT_LABELS = ('1-10', '11-20', '21-30', '31-40', '41-50', '50+')
+
+
 def _categorize_object_count(obj_count):
-    if obj_count <= 10:
-        return '1-10'
-    elif obj_count <= 20:
-        return '11-20'
-    elif obj_count <= 30:
-        return '21-30'
-    elif obj_count <= 40:
-        return '31-40'
-    elif obj_count <= 50:
-        return '41-50'
-    else:
-        return '50+'
+    return _OBJECT_COUNT_LABELS[bisect_left(_OBJECT_COUNT_EDGES, obj_count)]
 
 
 def _track_issue_thresholds(errors, issues):
@@ -2,8 +2,16 @@
 """CSV loading module supporting both old and new formats"""
 
 import csv
+import os
+from bisect import bisect_left, bisect_right
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
+from datetime import datetime
+from functools import lru_cache
+from itertools import chain, compress, repeat
+from operator import itemgetter
 from pathlib import Path
-from datetime import datetime, timedelta
 from ..utils.congestion_utils import get_congestion_level
 from ..utils.outlier_detection import (
     check_hard_bounds,
@@ -13,10 +21,14 @@ from ..utils.outlier_detection import (
 )
 
 
+@lru_cache(maxsize=65536)
 def _parse_time_to_seconds(time_str):
     """
     Parse time string to seconds
 
+    Memoized: durations repeat heavily across rows (a day's logs only contain a
+    few thousand distinct MM:SS values), so each distinct string is split once.
+
     Formats supported:
     - MM:SS (e.g., "00:06")     -> 6 seconds
     - HH:MM:SS (e.g., "01:23:45") -> 5025 seconds
@@ -40,38 +52,86 @@ def _parse_time_to_seconds(time_str):
         return 0
 
 
-def _parse_old_format_row(row, date_str):
+@lru_cache(maxsize=4096)
+def _is_valid_date(date_str):
+    """Whether a YYYY-MM-DD string is a real calendar date (as strptime would accept it)"""
+    try:
+        datetime.strptime(date_str, '%Y-%m-%d')
+    except ValueError:
+        return False
+    return True
+
+
+@lru_cache(maxsize=100_000)
+def _parse_time_of_day(timestamp_str):
+    """
+    Seconds since midnight of a 'YYYY-MM-DD HH:MM:SS' timestamp, or None if malformed
+
+    The canonical zero-padded layout is parsed by fixed-offset integer slicing;
+    anything else falls back to datetime.strptime. Memoized because many rows share
+    the same second; a day holds at most 86,400 distinct timestamps.
+    """
+    # Only ASCII digit time fields take the fast path (int() alone would accept signs and
+    # spaces) and only a valid date part returns from it, checked once per distinct date;
+    # every other string is left to strptime, which accepts looser layouts
+    if (len(timestamp_str) == 19 and timestamp_str.isascii() and timestamp_str[10] == ' '
+            and timestamp_str[13] == ':' and timestamp_str[16] == ':'
+            and (hh := timestamp_str[11:13]).isdigit() and (mm := timestamp_str[14:16]).isdigit()
+            and (ss := timestamp_str[17:19]).isdigit()):
+        hours, minutes, seconds = int(hh), int(mm), int(ss)
+        if hours < 24 and minutes < 60 and seconds < 60 and _is_valid_date(timestamp_str[:10]):
+            return hours * 3600 + minutes * 60 + seconds
+
+    try:
+        timestamp_dt = datetime.strptime(timestamp_str, '%Y-%m-%d %H:%M:%S')
+    except ValueError:
+        return None
+    return timestamp_dt.hour * 3600 + timestamp_dt.minute * 60 + timestamp_dt.second
+
+
+def _format_time_of_day(seconds):
+    """Format seconds since midnight as HH:MM:SS"""
+    return f"{seconds // 3600:02d}:{seconds % 3600 // 60:02d}:{seconds % 60:02d}"
+
+
+# Old-format columns in the order _parse_old_format_row unpacks them
+OLD_FORMAT_COLUMNS = ('timestamp', 'zone_id', 'objectCount', 'lidarEstTime', 'throughputEstTime', 'finalEstTime', 'actualPassTime')
+
+
+def _parse_old_format_row(values, date_str):
     """
     Parse old CSV format and adapt to the new format structure.
 
     Old Format: timestamp,zone_id,objectCount,lidarEstTime,throughputEstTime,finalEstTime,actualPassTime
     New Structure: timestamp,zone_id,objectCount,inTime,outTime,actualPassTime,lidarEstTime,throughputEstTime,finalEstTime
+
+    Args:
+        values: Row values ordered as OLD_FORMAT_COLUMNS
+        date_str: Date extracted from filename (YYYYMMDD)
     """
+    timestamp_str, zone_id, object_count, lidar_est_time, throughput_est_time, final_est_time, actual_pass_time = values
+
     # Basic data extraction and type conversion
-    actual_pass_time_seconds = int(row['actualPassTime'])
-    timestamp_str = row['timestamp']
-    
-    # Create datetime object from timestamp
-    try:
-        timestamp_dt = datetime.strptime(timestamp_str, '%Y-%m-%d %H:%M:%S')
-    except ValueError:
+    actual_pass_time_seconds = int(actual_pass_time)
+
+    # Time of day of the timestamp (outTime)
+    if (out_seconds := _parse_time_of_day(timestamp_str)) is None:
         return None  # Skip row if timestamp is malformed
 
-    # Calculate inTime and outTime
-    out_time_dt = timestamp_dt
-    in_time_dt = out_time_dt - timedelta(seconds=actual_pass_time_seconds)
+    # inTime wraps around midnight like the equivalent datetime arithmetic
+    in_seconds = (out_seconds - actual_pass_time_seconds) % 86400
 
     parsed = {
         'timestamp': timestamp_str,
         'object_id': None,  # Old format does not have object_id
-        'zone_id': int(row['zone_id']),
-        'objectCount': int(row['objectCount']),
-        'inTime': in_time_dt.strftime('%H:%M:%S'),
-        'outTime': out_time_dt.strftime('%H:%M:%S'),
+        'zone_id': int(zone_id),
+        'objectCount': int(object_count),
+        'inTime': _format_time_of_day(in_seconds),
+        'outTime': _format_time_of_day(out_seconds),
         'actualPassTime': actual_pass_time_seconds,
-        'lidarEstTime': float(row['lidarEstTime']),
-        'throughputEstTime': float(row['throughputEstTime']),
-        'finalEstTime': float(row['finalEstTime']),
+        'lidarEstTime': float(lidar_est_time),
+        'throughputEstTime': float(throughput_est_time),
+        'finalEstTime': float(final_est_time),
         'actualPassTime_str': f"{actual_pass_time_seconds // 60:02d}:{actual_pass_time_seconds % 60:02d}",
         'date': date_str
     }
@@ -82,6 +142,10 @@ def _parse_old_format_row(row, date_str):
     return parsed
 
 
+# Defaults for the optional trailing new-format columns 4-9 (inTime .. finalEstTime)
+NEW_FORMAT_OPTIONAL_DEFAULTS = (None, None, "00:00", 0.0, 0.0, 0.0)
+
+
 def _parse_new_format_row(row_values, date_str):
     """
     Parse new CSV format (no header, 10 columns)
@@ -107,33 +171,29 @@ def _parse_new_format_row(row_values, date_str):
     Returns:
         dict: Parsed row with standardized field names
     """
-    timestamp = row_values[0]
-    object_id = int(row_values[1])
-    zone_id = int(row_values[2])
-    zone_object_count = int(row_values[3])
-
-    in_time = row_values[4] if len(row_values) > 4 else None
-    out_time = row_values[5] if len(row_values) > 5 else None
-    actual_pass_time_str = row_values[6] if len(row_values) > 6 else "00:00"
+    # Full rows unpack directly; short rows are padded with the defaults of the
+    # missing trailing columns (rows missing a required column fail to unpack)
+    if len(row_values) != 10:
+        row_values = [*row_values[:10], *NEW_FORMAT_OPTIONAL_DEFAULTS[max(len(row_values) - 4, 0):]]
 
-    lidar_est_time = float(row_values[7]) if len(row_values) > 7 else 0.0
-    throughput_est_time = float(row_values[8]) if len(row_values) > 8 else 0.0
-    final_est_time = float(row_values[9]) if len(row_values) > 9 else 0.0
+    (timestamp, object_id, zone_id, zone_object_count, in_time, out_time,
+     actual_pass_time_str, lidar_est_time, throughput_est_time, final_est_time) = row_values
 
     actual_pass_time_seconds = _parse_time_to_seconds(actual_pass_time_str)
 
     parsed = {
         'timestamp': timestamp,
-        'object_id': object_id,
-        'zone_id': zone_id,
-        'objectCount': zone_object_count,
+        'object_id': int(object_id),
+        'zone_id': int(zone_id),
+        'objectCount': int(zone_object_count),
         'inTime': in_time,
         'outTime': out_time,
         'actualPassTime': actual_pass_time_seconds,
-        'lidarEstTime': lidar_est_time,
-        'throughputEstTime': throughput_est_time,
-        'finalEstTime': final_est_time,
-        'actualPassTime_str': actual_pass_time_str
+        'lidarEstTime': float(lidar_est_time),
+        'throughputEstTime': float(throughput_est_time),
+        'finalEstTime': float(final_est_time),
+        'actualPassTime_str': actual_pass_time_str,
+        'date': date_str
     }
 
     # Add congestion level
@@ -142,102 +202,156 @@ def _parse_new_format_row(row_values, date_str):
     return parsed
 
 
-def load_all_logs(log_dir="../csv", format_hint=None, from_date=None, to_date=None):
+def _csv_file_date(csv_file):
+    """Date part (YYYYMMDD) of a passingObject_YYYYMMDD.csv path"""
+    return csv_file.stem.replace('passingObject_', '')
+
+
+def _iter_csv_file(csv_file, format_hint=None):
     """
-    Load all queue log CSV files from directory
+    Lazily parse a single passingObject_YYYYMMDD.csv file in one pass
+
+    The format is detected from the first row (or forced via format_hint) and every
+    row is then handed to the matching row parser; malformed rows are skipped.
+
+    Args:
+        csv_file: Path to the CSV file
+        format_hint: Force format detection ('old' or 'new'), None for auto-detect
+
+    Yields:
+        dict: Parsed records from this file
+    """
+    date_str = _csv_file_date(csv_file)
+
+    with open(csv_file, 'r', encoding='utf-8', newline='') as f:
+        # Files are read front to back once; let the kernel prefetch aggressively
+        if hasattr(os, 'posix_fadvise'):
+            try:
+                os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            except OSError:
+                pass  # Only a hint: unsupported files or filesystems load without it
+
+        reader = csv.reader(f)
+        first_row = next(reader, None)
+
+        if first_row is None:
+            return
+
+        has_header = first_row[0] == 'timestamp'
+        detected_format = format_hint or ('old' if has_header else 'new')
+
+        if detected_format == 'old':
+            # Timestamps embed the date, so cached entries never hit across files
+            _parse_time_of_day.cache_clear()
+            # Resolve column positions from the header once instead of building a dict per row
+            try:
+                pick_columns = itemgetter(*(first_row.index(column) for column in OLD_FORMAT_COLUMNS))
+            except ValueError:
+                return  # Required column missing - no row of this file is parseable
+            for row in reader:
+                try:
+                    if parsed_row := _parse_old_format_row(pick_columns(row), date_str):
+                        yield parsed_row
+                except (ValueError, IndexError):
+                    continue
+        else:
+            rows = reader if has_header else chain((first_row,), reader)
+            for row in rows:
+                try:
+                    parsed_row = _parse_new_format_row(row, date_str)
+                except (ValueError, IndexError):
+                    continue
+                yield parsed_row
+
+
+def _load_csv_file(csv_file, format_hint=None):
+    """Parse a whole CSV file into a list (worker entry point for parallel ingest)"""
+    return list(_iter_csv_file(csv_file, format_hint))
+
+
+def iter_logs(log_dir="../csv", format_hint=None, from_date=None, to_date=None, workers=1):
+    """
+    Stream queue log records from all CSV files in a directory
+
+    The date range is applied to the filenames before any file is opened, and
+    records are yielded file by file so callers that filter as they go never hold
+    the unfiltered dataset in memory.
 
-    Automatically detects and handles both old and new CSV formats.
+    With workers > 1 the files are parsed in a process pool; results are still
+    yielded in filename order, but each file is held in memory until consumed.
+    Each "Loading:" line is printed when that file's records start to be yielded,
+    which with a pool is after the file has been parsed.
 
     Args:
         log_dir: Directory containing CSV files (default: 'csv')
         format_hint: Force format detection ('old' or 'new'), None for auto-detect
         from_date: Optional start date filter in YYYYMMDD format (inclusive)
         to_date: Optional end date filter in YYYYMMDD format (inclusive)
+        workers: Number of parser processes, None for os.cpu_count() (default: 1, sequential)
 
-    Returns:
-        list: Parsed log records with standardized fields
+    Yields:
+        dict: Parsed log records with standardized fields
     """
     log_path = Path(log_dir)
-    all_data = []
 
     if not log_path.exists():
         print(f"Warning: Directory '{log_dir}' not found.")
-        return all_data
+        return
 
-    csv_files = sorted(log_path.glob("passingObject_*.csv"))
+    # Sorted by embedded date (YYYYMMDD) so a date range maps to a contiguous slice
+    csv_files = sorted(log_path.glob("passingObject_*.csv"), key=_csv_file_date)
 
     if not csv_files:
         print(f"Warning: No CSV files found in '{log_dir}' directory.")
-        return all_data
+        return
 
     # Filter CSV files by date range if specified
     if from_date or to_date:
-        filtered_files = []
-        for csv_file in csv_files:
-            date_str = csv_file.stem.replace('passingObject_', '')
-            if from_date and date_str < from_date:
-                continue
-            if to_date and date_str > to_date:
-                continue
-            filtered_files.append(csv_file)
-        csv_files = filtered_files
+        dates = [_csv_file_date(csv_file) for csv_file in csv_files]
+        lo = bisect_left(dates, from_date) if from_date else 0
+        hi = bisect_right(dates, to_date) if to_date else len(dates)
+        csv_files = csv_files[lo:hi]
         print(f"Date filter applied: {len(csv_files)} files selected (from: {from_date or 'any'}, to: {to_date or 'any'})")
 
         if not csv_files:
             print(f"Warning: No CSV files match the date range filter.")
-            return all_data
+            return
 
-    for csv_file in csv_files:
-        print(f"Loading: {csv_file.name}...")
-        date_str = csv_file.stem.replace('passingObject_', '')
+    workers = min(workers or os.cpu_count() or 1, len(csv_files))
 
-        with open(csv_file, 'r', encoding='utf-8') as f:
-            reader = csv.reader(f)
-            first_row = next(reader, None)
+    with ProcessPoolExecutor(max_workers=workers) if workers > 1 else nullcontext() as executor:
+        # Both maps preserve file order; the sequential one parses lazily as it is consumed
+        file_records = (executor.map(_load_csv_file, csv_files, repeat(format_hint)) if executor
+                        else map(_iter_csv_file, csv_files, repeat(format_hint)))
 
-            if first_row is None:
-                continue
+        total = 0
+        for csv_file, records in zip(csv_files, file_records):
+            print(f"Loading: {csv_file.name}...")
+            for total, record in enumerate(records, total + 1):
+                yield record
 
-            if format_hint:
-                detected_format = format_hint
-            else:
-                if first_row[0] == 'timestamp':
-                    detected_format = 'old'
-                else:
-                    detected_format = 'new'
-
-            if detected_format == 'old':
-                f.seek(0)
-                reader_dict = csv.DictReader(f)
-                for row in reader_dict:
-                    try:
-                        parsed_row = _parse_old_format_row(row, date_str)
-                        if parsed_row:
-                            all_data.append(parsed_row)
-                    except (ValueError, KeyError):
-                        continue
-            else:
-                if first_row[0] == 'timestamp':
-                    first_row = next(reader, None)
-
-                if first_row:
-                    try:
-                        parsed_row = _parse_new_format_row(first_row, date_str)
-                        parsed_row['date'] = date_str
-                        all_data.append(parsed_row)
-                    except (ValueError, IndexError):
-                        pass
-
-                for row in reader:
-                    try:
-                        parsed_row = _parse_new_format_row(row, date_str)
-                        parsed_row['date'] = date_str
-                        all_data.append(parsed_row)
-                    except (ValueError, IndexError):
-                        continue
-
-    print(f"Loaded a total of {len(all_data):,} records.")
-    return all_data
+    print(f"Loaded a total of {total:,} records.")
+
+
+def load_all_logs(log_dir="../csv", format_hint=None, from_date=None, to_date=None, workers=1):
+    """
+    Load all queue log CSV files from directory
+
+    Automatically detects and handles both old and new CSV formats. Parallel
+    parsing is opt-in via workers; callers must then guard their entry point
+    with `if __name__ == '__main__':` (spawn start method on Windows/macOS).
+
+    Args:
+        log_dir: Directory containing CSV files (default: 'csv')
+        format_hint: Force format detection ('old' or 'new'), None for auto-detect
+        from_date: Optional start date filter in YYYYMMDD format (inclusive)
+        to_date: Optional end date filter in YYYYMMDD format (inclusive)
+        workers: Number of parser processes, None for os.cpu_count() (default: 1, sequential)
+
+    Returns:
+        list: Parsed log records with standardized fields
+    """
+    return list(iter_logs(log_dir, format_hint=format_hint, from_date=from_date, to_date=to_date, workers=workers))
 
 
 def filter_outliers(data,
@@ -253,7 +367,8 @@ def filter_outliers(data,
     Stage 2: Adaptive bounds by (zone_id, congestion_level) + fallback hard bounds
 
     Args:
-        data: List of record dictionaries with 'zone_id', 'congestion_level', 'actualPassTime'
+        data: Iterable of record dictionaries with 'zone_id', 'congestion_level', 'actualPassTime'
+              (a list, or a stream such as iter_logs(); stage 1 consumes it in a single pass)
         min_sample_threshold: Minimum samples required for adaptive filtering (default: 10)
         adaptive_lower_mult: Lower bound multiplier (default: 0.3 for 30%)
         adaptive_upper_mult: Upper bound multiplier (default: 1.7 for 170%)
@@ -263,37 +378,53 @@ def filter_outliers(data,
     Returns:
         tuple: (filtered_data, outlier_stats)
     """
-    print("\n이상치 탐지 (2단계 필터링)...")
-
     # Stage 1: Apply hard-coded zone-congestion bounds
     stage1_data = []
+    # Per-outcome record counts keyed by (zone_id, congestion_level)
     tracking = {
-        'removed_by_hard_bounds_stage1': [],
-        'removed_by_adaptive': [],
-        'kept_records': [],
-        'skipped_adaptive_groups': []
+        'removed_by_hard_bounds_stage1': Counter(),
+        'removed_by_adaptive': Counter(),
+        'kept_records': Counter(),
+        'skipped_adaptive_groups': Counter()
     }
 
     if enable_stage1_hard_bounds:
-        for record in data:
-            if check_hard_bounds(record):
-                stage1_data.append(record)
-            else:
-                tracking['removed_by_hard_bounds_stage1'].append(record)
-        print(f"  Stage 1: {len(data):,}건 → {len(stage1_data):,}건 (제거: {len(tracking['removed_by_hard_bounds_stage1']):,}건)")
+        total_count = 0
+        in_bounds = check_hard_bounds  # Local binding for the per-record loop
+        if enable_adaptive:
+            # build_outlier_statistics reports stage-1 removals per group
+            removed_stage1 = tracking['removed_by_hard_bounds_stage1']
+            for total_count, record in enumerate(data, 1):
+                if in_bounds(record):
+                    stage1_data.append(record)
+                else:
+                    # Count only the group key so rejected records can be released
+                    removed_stage1[(record.get('zone_id'), record.get('congestion_level'))] += 1
+        else:
+            # Legacy mode only reports the total, so rejected records need no group key
+            for total_count, record in enumerate(data, 1):
+                if in_bounds(record):
+                    stage1_data.append(record)
+    else:
+        stage1_data = data if isinstance(data, list) else list(data)
+        total_count = len(stage1_data)
+
+    # Printed once a streamed input is drained, so the loader's progress lines come first
+    print("\n이상치 탐지 (2단계 필터링)...")
+    if enable_stage1_hard_bounds:
+        print(f"  Stage 1: {total_count:,}건 → {len(stage1_data):,}건 (제거: {total_count - len(stage1_data):,}건)")
     else:
-        stage1_data = data
         print(f"  Stage 1: 스킵됨")
 
     # Legacy mode: skip stage 2
     if not enable_adaptive:
         outlier_stats = {
-            'total_records': len(data),
-            'removed_records': len(data) - len(stage1_data),
+            'total_records': total_count,
+            'removed_records': total_count - len(stage1_data),
             'filtered_records': len(stage1_data),
-            'removal_rate_pct': ((len(data) - len(stage1_data)) / len(data) * 100) if len(data) > 0 else 0,
+            'removal_rate_pct': ((total_count - len(stage1_data)) / total_count * 100) if total_count > 0 else 0,
             'removal_breakdown': {
-                'removed_by_hard_bounds_stage1': len(tracking['removed_by_hard_bounds_stage1']),
+                'removed_by_hard_bounds_stage1': total_count - len(stage1_data),
                 'removed_by_adaptive': 0,
                 'skipped_groups_count': 0,
             }
@@ -303,42 +434,29 @@ def filter_outliers(data,
     # Stage 2: Compute group statistics on stage1 data
     group_stats = compute_group_statistics(stage1_data, min_sample_threshold, adaptive_lower_mult, adaptive_upper_mult)
 
-    # Stage 2: Apply adaptive filtering
-    filtered_data = []
+    # Stage 2: Classify records into a keep mask in one pass and count outcomes per group key
+    keep_mask = bytearray(b'\x01') * len(stage1_data)
+    kept, skipped, removed_adaptive = (tracking[name] for name in ('kept_records', 'skipped_adaptive_groups', 'removed_by_adaptive'))
 
-    for record in stage1_data:
-        zone = record.get('zone_id')
-        congestion = record.get('congestion_level')
+    for i, record in enumerate(stage1_data):
+        key = (record.get('zone_id'), record.get('congestion_level'))
         actual_time = record.get('actualPassTime')
 
-        # Missing required fields - keep (already passed stage 1)
-        if zone is None or congestion is None or actual_time is None:
-            filtered_data.append(record)
-            tracking['kept_records'].append(record)
-            continue
-
-        stats = group_stats.get((zone, congestion))
-
-        # No statistics for this group - keep (already passed stage 1)
-        if stats is None:
-            filtered_data.append(record)
-            tracking['kept_records'].append(record)
-            continue
-
+        # Missing required fields or no statistics for this group - keep (already passed stage 1)
+        if actual_time is None or None in key or (stats := group_stats.get(key)) is None:
+            kept[key] += 1
         # Small sample group - skip adaptive
-        if stats['skip_adaptive_filter']:
-            filtered_data.append(record)
-            tracking['skipped_adaptive_groups'].append(record)
-            continue
-
+        elif stats.skip_adaptive_filter:
+            skipped[key] += 1
         # Apply adaptive filter
-        if not (stats['lower_bound'] <= actual_time <= stats['upper_bound']):
-            tracking['removed_by_adaptive'].append(record)
-            continue
-
+        elif not (stats.lower_bound <= actual_time <= stats.upper_bound):
+            removed_adaptive[key] += 1
+            keep_mask[i] = 0
         # Passed all filters
-        filtered_data.append(record)
-        tracking['kept_records'].append(record)
+        else:
+            kept[key] += 1
+
+    filtered_data = list(compress(stage1_data, keep_mask))
 
     # Build statistics
     config = {
@@ -348,7 +466,7 @@ def filter_outliers(data,
         'enable_stage1_hard_bounds': enable_stage1_hard_bounds,
     }
 
-    outlier_stats = build_outlier_statistics(data, filtered_data, group_stats, tracking, config)
+    outlier_stats = build_outlier_statistics(total_count, filtered_data, group_stats, tracking, config)
 
     # Print summary
     print_filter_summary(outlier_stats)
@@ -3,9 +3,16 @@
 
 import json
 from collections import defaultdict
+from functools import lru_cache
 from ..utils.time_utils import extract_hour_from_time
 
 
+@lru_cache(maxsize=100_000)
+def _hour_of(time_str):
+    """Hour of an HH:MM:SS string, sliced directly when zero-padded (memoized per string)"""
+    return int(time_str[:2]) if time_str[2:3] == ':' else extract_hour_from_time(time_str)
+
+
 class TimeOfDayEnhancer:
     """
     Calculates hourly correction factors based on historical error patterns
@@ -33,32 +40,37 @@ class TimeOfDayEnhancer:
         Train time-of-day adjustment factors
 
         Args:
-            records: List of data records with predictions and actuals
+            records: Iterable of data records with predictions and actuals
             min_samples_per_hour: Minimum records needed per hour (default: 10)
             smoothing_factor: Blend with global average (0=full smoothing, 1=no smoothing)
 
         Returns:
             dict: Training statistics
         """
-        # Group records by hour
-        hourly_data = defaultdict(lambda: {alg: [] for alg in self.algorithms})
-        hourly_actuals = defaultdict(list)
+        # Accumulate per-hour sums and counts (no per-record lists are kept)
+        ratio_sums = defaultdict(lambda: dict.fromkeys(self.algorithms, 0))
+        ratio_counts = defaultdict(lambda: dict.fromkeys(self.algorithms, 0))
+        actual_sums = defaultdict(int)
+        actual_counts = defaultdict(int)
 
         for record in records:
             # Extract hour from inTime (entry time is most relevant)
-            hour = extract_hour_from_time(record.get('inTime', record['timestamp'].split()[1]))
+            hour = _hour_of(record['inTime'] if 'inTime' in record else record['timestamp'].split()[1])
 
-            hourly_actuals[hour].append(record['actualPassTime'])
+            actual = record['actualPassTime']
+            actual_sums[hour] += actual
+            actual_counts[hour] += 1
 
+            sums, counts = ratio_sums[hour], ratio_counts[hour]
             for alg in self.algorithms:
-                if record[alg] > 0:  # Avoid division by zero
-                    error_ratio = record['actualPassTime'] / record[alg]
-                    hourly_data[hour][alg].append(error_ratio)
+                if (prediction := record[alg]) > 0:  # Avoid division by zero
+                    sums[alg] += actual / prediction
+                    counts[alg] += 1
 
         # Calculate global average ratio as baseline
         global_ratios = {
-            alg: (sum(sum(hourly_data[h][alg]) for h in range(24)) /
-                  sum(len(hourly_data[h][alg]) for h in range(24)))
+            alg: (sum(ratio_sums[h][alg] for h in range(24)) /
+                  sum(ratio_counts[h][alg] for h in range(24)))
             for alg in self.algorithms
         }
 
@@ -67,10 +79,8 @@ class TimeOfDayEnhancer:
             self.hourly_factors[alg] = {}
 
             for hour in range(24):
-                ratios = hourly_data[hour][alg]
-
-                if len(ratios) >= min_samples_per_hour:
-                    mean_ratio = sum(ratios) / len(ratios)
+                if (count := ratio_counts[hour][alg]) >= min_samples_per_hour:
+                    mean_ratio = ratio_sums[hour][alg] / count
                     # Smooth with global average to avoid overfitting
                     adjusted_factor = (smoothing_factor * mean_ratio +
                                       (1 - smoothing_factor) * global_ratios[alg])
@@ -83,9 +93,9 @@ class TimeOfDayEnhancer:
         # Calculate statistics
         self.hourly_stats = {
             hour: {
-                'record_count': len(hourly_actuals[hour]),
-                'avg_actual_time': (sum(hourly_actuals[hour]) / len(hourly_actuals[hour])
-                                   if hourly_actuals[hour] else 0),
+                'record_count': actual_counts[hour],
+                'avg_actual_time': (actual_sums[hour] / actual_counts[hour]
+                                   if actual_counts[hour] else 0),
                 'factors': {alg: self.hourly_factors[alg].get(hour, 1.0)
                            for alg in self.algorithms}
             }
@@ -95,8 +105,8 @@ class TimeOfDayEnhancer:
         self.is_trained = True
 
         return {
-            'total_records': len(records),
-            'hours_with_data': len([h for h in range(24) if hourly_actuals[h]]),
+            'total_records': sum(actual_counts.values()),
+            'hours_with_data': sum(1 for h in range(24) if actual_counts[h]),
             'global_ratios': global_ratios,
             'hourly_stats': self.hourly_stats
         }
@@ -114,16 +124,23 @@ class TimeOfDayEnhancer:
         if not self.is_trained:
             raise ValueError("Enhancer must be trained before transform. Call fit() first.")
 
+        # Resolve (algorithm, output key, factor) once per hour rather than per record
+        factors_by_hour = {}
+        adjusted_keys = [f"{alg}_tod_adjusted" for alg in self.algorithms]
         adjusted_records = []
 
         for record in records:
-            hour = extract_hour_from_time(record.get('inTime', record['timestamp'].split()[1]))
+            hour = _hour_of(record['inTime'] if 'inTime' in record else record['timestamp'].split()[1])
+
+            if (hour_factors := factors_by_hour.get(hour)) is None:
+                hour_factors = factors_by_hour[hour] = [
+                    (alg, adjusted_key, self.hourly_factors[alg].get(hour, 1.0))
+                    for alg, adjusted_key in zip(self.algorithms, adjusted_keys)
+                ]
 
             adjusted = {**record}  # Copy all existing fields
 
-            for alg in self.algorithms:
-                factor = self.hourly_factors[alg].get(hour, 1.0)
-                adjusted_key = f"{alg}_tod_adjusted"
+            for alg, adjusted_key, factor in hour_factors:
                 adjusted[adjusted_key] = round(record[alg] * factor)
 
             adjusted_records.append(adjusted)
@@ -146,6 +163,10 @@ class TimeOfDayEnhancer:
         with open(filepath, 'r', encoding='utf-8') as f:
             data = json.load(f)
 
-        self.hourly_factors = data['hourly_factors']
-        self.hourly_stats = data['hourly_stats']
+        # JSON object keys are strings; restore the integer hours transform() looks up
+        self.hourly_factors = {
+            alg: {int(hour): factor for hour, factor in factors.items()}
+            for alg, factors in data['hourly_factors'].items()
+        }
+        self.hourly_stats = {int(hour): stats for hour, stats in data['hourly_stats'].items()}
         self.is_trained = True
@@ -15,6 +15,7 @@ Output:
     Date range is extracted from CSV filenames in the data directory
 """
 
+import os
 import sys
 import argparse
 from pathlib import Path
@@ -29,6 +30,7 @@ sys.path.insert(0, str(project_root))
 from src.new.tables.table_data_loader import load_and_process_data
 
 from src.new.tables.table_generators import (
+    aggregate_table_data,
     generate_zone_by_day_table,
     generate_zone_by_queue_table,
     generate_zone_by_congestion_table,
@@ -64,19 +66,18 @@ def validate_date_format(date_str):
 
 def extract_date_range_from_csv_dir(data_dir):
     """Extract the date range (from-to) from CSV filenames in directory"""
-    csv_files = list(Path(data_dir).glob("passingObject_*.csv"))
-    if not csv_files:
-        today = datetime.now().strftime('%Y%m%d')
-        return today, today
-
-    # Extract dates from filenames (format: passingObject_YYYYMMDD.csv)
-    dates = []
-    for csv_file in csv_files:
-        try:
-            date_str = csv_file.stem.split('_')[1]  # Get YYYYMMDD part
-            dates.append(date_str)
-        except (IndexError, ValueError):
-            continue
+    # Extract dates from filenames (format: passingObject_YYYYMMDD.csv) in a single
+    # directory scan over entry names - no Path objects or per-file stem parsing
+    prefix, suffix = 'passingObject_', '.csv'
+    try:
+        with os.scandir(data_dir) as entries:
+            dates = [
+                name[len(prefix):-len(suffix)].split('_')[0]  # Get YYYYMMDD part
+                for entry in entries
+                if (name := entry.name).startswith(prefix) and name.endswith(suffix)
+            ]
+    except OSError:
+        dates = []
 
     if not dates:
         today = datetime.now().strftime('%Y%m%d')
@@ -116,15 +117,9 @@ def generate_outlier_detection_header(outlier_stats, from_date, to_date):
     lower_mult = config.get('adaptive_lower_mult', 0.3)
     upper_mult = config.get('adaptive_upper_mult', 1.7)
 
-    # Calculate congestion level breakdown
-    from collections import defaultdict
-    congestion_stats = defaultdict(lambda: {'kept': 0, 'removed_stage1': 0, 'removed_adaptive': 0})
-
-    group_stats = outlier_stats.get('group_statistics', {})
-    for (zone_id, congestion_level), stats in group_stats.items():
-        congestion_stats[congestion_level]['kept'] += stats.get('kept', 0)
-        congestion_stats[congestion_level]['removed_stage1'] += stats.get('removed_by_hard_bounds_stage1', 0)
-        congestion_stats[congestion_level]['removed_adaptive'] += stats.get('removed_adaptive', 0)
+    # Congestion level breakdown: [kept, removed_stage1, removed_adaptive] per level
+    # (absent when stage-2 filtering was disabled)
+    congestion_stats = outlier_stats.get('per_congestion', {})
 
     header = [
         "# 대기시간 예측 알고리즘 분석 보고서\n",
@@ -154,29 +149,22 @@ def generate_outlier_detection_header(outlier_stats, from_date, to_date):
         f"| **최종 분석 대상** | **{outlier_stats['filtered_records']:,}건** | **{(outlier_stats['filtered_records']/outlier_stats['total_records']*100):.1f}%** |\n",
         "### 혼잡도별 필터링 통계\n",
         f"| 혼잡도 | 유지 건수 | Stage 1 제거 | Stage 2 제거 | 유지율 |",
-        f"|------|----------|-------------|-------------|--------|"
-    ]
-
-    # Add congestion level rows
-    for congestion_level in ['Low', 'Medium', 'High', 'Very High']:
-        stats = congestion_stats.get(congestion_level, {'kept': 0, 'removed_stage1': 0, 'removed_adaptive': 0})
-        total_cong = stats['kept'] + stats['removed_stage1'] + stats['removed_adaptive']
-        if total_cong > 0:
-            kept_pct = (stats['kept'] / total_cong * 100)
-            header.append(
-                f"| {congestion_level} | {stats['kept']:,}건 | {stats['removed_stage1']:,}건 | "
-                f"{stats['removed_adaptive']:,}건 | {kept_pct:.1f}% |"
-            )
-
-    header.extend([
+        f"|------|----------|-------------|-------------|--------|",
+        # Congestion level rows
+        *(
+            f"| {congestion_level} | {kept:,}건 | {removed_stage1:,}건 | "
+            f"{removed_adaptive:,}건 | {kept / total_cong * 100:.1f}% |"
+            for congestion_level, (kept, removed_stage1, removed_adaptive) in congestion_stats.items()
+            if (total_cong := kept + removed_stage1 + removed_adaptive) > 0
+        ),
         "\n> **참고:** 센서 오류나 비정상적인 측정값은 2단계 필터링을 통해 자동으로 제거됩니다.\n",
         "---\n"
-    ])
+    ]
 
     return "\n".join(header)
 
 
-def main(data_dir, from_date=None, to_date=None):
+def main(data_dir, from_date=None, to_date=None, workers=1):
     """
     Main pipeline for generating summary tables.
 
@@ -184,12 +172,13 @@ def main(data_dir, from_date=None, to_date=None):
         data_dir: Directory containing CSV files
         from_date: Optional start date in YYYYMMDD format
         to_date: Optional end date in YYYYMMDD format
+        workers: Number of CSV parser processes, None for os.cpu_count() (default: 1)
     """
     print("--- Summary Table Generation Pipeline ---")
 
     # Load and process data
     print(f"Loading data from '{data_dir}'...")
-    data, outlier_stats = load_and_process_data(data_dir, from_date=from_date, to_date=to_date)
+    data, outlier_stats = load_and_process_data(data_dir, from_date=from_date, to_date=to_date, workers=workers)
 
     if not data:
         print("No data loaded. Exiting.")
@@ -198,38 +187,27 @@ def main(data_dir, from_date=None, to_date=None):
     print(f"Loaded and filtered {len(data)} records.")
 
     # Extract date range for output filename
-    # If date filters were provided, use them; otherwise extract from all CSV files
-    if from_date or to_date:
-        # Use the provided date filters for the filename
-        output_from_date = from_date if from_date else extract_date_range_from_csv_dir(data_dir)[0]
-        output_to_date = to_date if to_date else extract_date_range_from_csv_dir(data_dir)[1]
+    # Provided date filters win; the CSV directory is scanned (once) only for a missing bound
+    if from_date and to_date:
+        output_from_date, output_to_date = from_date, to_date
     else:
-        # No filters provided, extract from all files
-        output_from_date, output_to_date = extract_date_range_from_csv_dir(data_dir)
+        min_date, max_date = extract_date_range_from_csv_dir(data_dir)
+        output_from_date = from_date or min_date
+        output_to_date = to_date or max_date
 
     # Generate header with outlier detection summary
     print("Generating report header...")
     header = generate_outlier_detection_header(outlier_stats, output_from_date, output_to_date)
 
-    # Generate all tables
+    # Generate all tables from a single shared aggregation pass over the data
     print("Generating tables...")
-    zone_by_day_table = generate_zone_by_day_table(data)
-    zone_by_queue_table = generate_zone_by_queue_table(data)
-    zone_by_congestion_table = generate_zone_by_congestion_table(data)
-    queue_by_day_table = generate_queue_by_day_table(data)
-    sample_count_table = generate_sample_count_table(data)
-    summary_stats_table = generate_summary_statistics_table(data)
-
-    # Combine header and tables into a single document
-    full_report = (
-        f"{header}\n"
-        f"{zone_by_congestion_table}\n\n"
-        f"{zone_by_queue_table}\n\n"
-        f"{zone_by_day_table}\n\n"
-        f"{queue_by_day_table}\n\n"
-        f"{sample_count_table}\n\n"
-        f"{summary_stats_table}"
-    )
+    groups = aggregate_table_data(data)
+    zone_by_day_table = generate_zone_by_day_table(data, groups)
+    zone_by_queue_table = generate_zone_by_queue_table(data, groups)
+    zone_by_congestion_table = generate_zone_by_congestion_table(data, groups)
+    queue_by_day_table = generate_queue_by_day_table(data, groups)
+    sample_count_table = generate_sample_count_table(data, groups)
+    summary_stats_table = generate_summary_statistics_table(data, groups)
 
     # Create result directory if it doesn't exist
     result_dir = project_root / "resource" / "result"
@@ -239,9 +217,17 @@ def main(data_dir, from_date=None, to_date=None):
     output_filename = f"대기시간_통계분석_{output_from_date}_{output_to_date}.md"
     output_path = result_dir / output_filename
 
-    # Save to output file
+    # Write header and tables straight to the output file (no combined report string)
     with open(output_path, "w", encoding="utf-8") as f:
-        f.write(full_report)
+        f.writelines([
+            header, "\n",
+            zone_by_congestion_table, "\n\n",
+            zone_by_queue_table, "\n\n",
+            zone_by_day_table, "\n\n",
+            queue_by_day_table, "\n\n",
+            sample_count_table, "\n\n",
+            summary_stats_table,
+        ])
 
     print(f"Successfully generated summary tables in '{output_path}'")
 
@@ -271,6 +257,13 @@ if __name__ == '__main__':
         metavar='YYYYMMDD',
         help='End date filter (inclusive, format: YYYYMMDD)'
     )
+    parser.add_argument(
+        '--workers', '-j',
+        type=int,
+        default=1,
+        metavar='N',
+        help='Number of processes for parsing CSV files, 0 for all CPUs (default: 1)'
+    )
 
     args = parser.parse_args()
 
@@ -288,7 +281,11 @@ if __name__ == '__main__':
         print(f"Error: --from date ({args.from_date}) cannot be later than --to date ({args.to_date})")
         sys.exit(1)
 
+    # Validate worker count (0 means all CPUs)
+    if args.workers < 0:
+        parser.error(f"--workers must be 0 or a positive number, got {args.workers}")
+
     # Resolve paths
     _data_dir = project_root / 'resource' / args.data_dir
 
-    main(_data_dir, from_date=args.from_date, to_date=args.to_date)
+    main(_data_dir, from_date=args.from_date, to_date=args.to_date, workers=args.workers or None)
@@ -1,6 +1,7 @@
 """Table generation and formatting modules"""
 
 from .table_generators import (
+    aggregate_table_data,
     generate_zone_by_day_table,
     generate_zone_by_queue_table,
     generate_queue_by_day_table,
@@ -11,6 +12,7 @@ from .table_utils import get_day_of_week, categorize_queue_size, calculate_stats
 from .table_data_loader import load_and_process_data
 
 __all__ = [
+    'aggregate_table_data',
     'generate_zone_by_day_table',
     'generate_zone_by_queue_table',
     'generate_queue_by_day_table',
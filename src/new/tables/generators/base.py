@@ -1,6 +1,13 @@
 #!/usr/bin/env python3
 """Base class for table generators"""
 
+import math
+import statistics
+from collections import defaultdict
+from itertools import chain, repeat
+from ..table_utils import get_day_of_week, categorize_queue_size
+from ...utils.congestion_utils import get_congestion_level
+
 
 class BaseTableGenerator:
     """Base class for table generators with common functionality"""
@@ -29,19 +36,130 @@ class BaseTableGenerator:
         16: '보안검색2',
         17: '보안검색1',
     }
-    def __init__(self, data):
+    # {zone: display name} for table rows, resolved once instead of per row (ZONE_NAME_DICT is passed
+    # in through the iterable: a comprehension in the class body cannot see class attributes)
+    ZONE_LABELS = {zone: names.get(zone, f'구역 {zone}') for zone, names in zip(ALL_ZONES, repeat(ZONE_NAME_DICT))}
+    # Positions of the dimensions in a pre-aggregated group key
+    ZONE, DAY, QUEUE, CONGESTION = range(4)
+
+    def __init__(self, data, groups=None):
         self.data = data
+        self._groups = groups
+
+    @property
+    def groups(self):
+        """Pre-aggregated groups of self.data (built on first use unless shared via the constructor)"""
+        if self._groups is None:
+            self._groups = self.aggregate(self.data)
+        return self._groups
+
+    @classmethod
+    def aggregate(cls, data):
+        """
+        Group rows once by (zone_id, day, queue category, congestion level)
+
+        Day of week, queue bucket, congestion level and error are resolved once per row,
+        so every table can be rolled up from the groups instead of rescanning the data.
+
+        Args:
+            data: Iterable of filtered records
+
+        Returns:
+            dict: {(zone, day, queue_cat, congestion): group} where group holds the error values
+                  ('errors', kept for medians; their length is the sample count), the predicted wait
+                  times ('predicted', kept for an exactly rounded mean) and the integer actual wait
+                  time sum and min/max ('actual_sum', 'actual_min', 'actual_max')
+        """
+        groups = defaultdict(lambda: {
+            'errors': [], 'predicted': [], 'actual_sum': 0, 'actual_min': math.inf, 'actual_max': -math.inf
+        })
+
+        for row in data:
+            day_eng = get_day_of_week(row['timestamp'])  # Memoized per date token
+            key = (
+                row['zone_id'],
+                cls.DAY_MAPPING.get(day_eng, day_eng),
+                categorize_queue_size(row['objectCount']),
+                row.get('congestion_level') or get_congestion_level(row),
+            )
+            group = groups[key]
+            predicted, actual = row['finalEstTime'], row['actualPassTime']
+            group['errors'].append((predicted - actual) / 60.0)  # Error in minutes (+: over-estimate)
+            group['predicted'].append(predicted)
+            group['actual_sum'] += actual
+            if actual < group['actual_min']:
+                group['actual_min'] = actual
+            if actual > group['actual_max']:
+                group['actual_max'] = actual
+
+        return dict(groups)
+
+    def _rollup(self, dimension):
+        """Merge group error values down to one dimension: {value: [...]}"""
+        rolled = defaultdict(list)
+
+        for key, group in self.groups.items():
+            rolled[key[dimension]].extend(group['errors'])
+
+        return rolled
+
+    def _rollup_groups(self, outer, inner):
+        """Collect the groups of each (outer, inner) cell without copying values: {outer: {inner: [group, ...]}}"""
+        rolled = defaultdict(lambda: defaultdict(list))
+
+        for key, group in self.groups.items():
+            rolled[key[outer]][key[inner]].append(group)
+
+        return rolled
+
+    @staticmethod
+    def _mean_error(groups):
+        """Mean error over several groups (statistics.mean keeps the exactly rounded mean the tables print)"""
+        return statistics.mean(chain.from_iterable(group['errors'] for group in groups))
+
+    @staticmethod
+    def _count(groups):
+        """Sample count over several groups"""
+        return sum(len(group['errors']) for group in groups)
+
+    def _format_error_row(self, label, cells, columns, with_count=False):
+        """
+        Format one mean-error row: a cell per column ('-' if empty) and the bold row average
+
+        Args:
+            label: Row label (rendered bold)
+            cells: {column: [group, ...]} as returned per outer key by _rollup_groups
+            columns: Column keys in display order
+            with_count: Append the sample count to each cell
+
+        Returns:
+            str: Markdown table row
+        """
+        row_data = [f"**{label}**"]
+        row_groups = []
+
+        for column in columns:
+            if groups := cells.get(column):
+                cell = f"{self._mean_error(groups):+.2f}"
+                row_data.append(f"{cell} ({self._count(groups):,})" if with_count else cell)
+                row_groups.extend(groups)
+            else:
+                row_data.append("-")
+
+        row_data.append(f"**{self._mean_error(row_groups):+.2f}**" if row_groups else "-")
+        return self._format_row(row_data)
 
-    def _calculate_error_minutes(self, row):
-        """Calculate error in minutes from a data row"""
-        return (row['finalEstTime'] - row['actualPassTime']) / 60.0
+    @staticmethod
+    def _format_row(cells):
+        """Format cell strings as one markdown table row"""
+        return f"| {' | '.join(cells)} |"
 
     def _format_markdown_table(self, headers, rows, separator_count=None):
         """Format data as markdown table"""
         if separator_count is None:
             separator_count = len(headers)
 
-        md = [f"| {' | '.join(headers)} |"]
+        md = [self._format_row(headers)]
         md.append(f"|{'---|' * separator_count}")
         md.extend(rows)
         return md
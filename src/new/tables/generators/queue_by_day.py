@@ -1,26 +1,16 @@
 #!/usr/bin/env python3
 """Queue size by day of week table generator"""
 
-import statistics
-from collections import defaultdict
 from .base import BaseTableGenerator
-from ..table_utils import get_day_of_week, categorize_queue_size
 
 
 class QueueByDayTableGenerator(BaseTableGenerator):
     """Generate average error by queue size and day of week table"""
 
     def generate(self):
-        queue_day_errors = defaultdict(lambda: defaultdict(list))
+        queue_day_groups = self._rollup_groups(self.QUEUE, self.DAY)
 
-        for row in self.data:
-            queue_cat = categorize_queue_size(row['objectCount'])
-            day_eng = get_day_of_week(row['timestamp'])
-            day = super().DAY_MAPPING.get(day_eng, day_eng)
-            error_minutes = self._calculate_error_minutes(row)
-            queue_day_errors[queue_cat][day].append(error_minutes)
-
-        queue_cats = sorted(queue_day_errors.keys(), key=lambda x: int(x.split('-')[0]))
+        queue_cats = sorted(queue_day_groups.keys(), key=lambda x: int(x.split('-')[0]))
 
         md = ["\n\n# 대기인원별 요일별 평균 오차\n"]
         md.append("## 평균 오차 (분) | +: 과대추정, -: 과소추정\n")
@@ -29,25 +19,7 @@ class QueueByDayTableGenerator(BaseTableGenerator):
         rows = []
 
         for queue in queue_cats:
-            row_data = [f"**{queue}명**"]
-            queue_all_errors = []
-
-            for day in super().DAYS:
-                errors = queue_day_errors[queue][day]
-                if errors:
-                    avg = statistics.mean(errors)
-                    row_data.append(f"{avg:+.2f}")
-                    queue_all_errors.extend(errors)
-                else:
-                    row_data.append("-")
-
-            if queue_all_errors:
-                queue_avg = statistics.mean(queue_all_errors)
-                row_data.append(f"**{queue_avg:+.2f}**")
-            else:
-                row_data.append("-")
-
-            rows.append("| " + " | ".join(row_data) + " |")
+            rows.append(self._format_error_row(f"{queue}명", queue_day_groups[queue], super().DAYS))
 
         md.extend(self._format_markdown_table(headers, rows))
         return "\n".join(md)
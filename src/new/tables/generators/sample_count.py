@@ -3,7 +3,6 @@
 
 from collections import defaultdict
 from .base import BaseTableGenerator
-from ..table_utils import get_day_of_week
 
 
 class SampleCountTableGenerator(BaseTableGenerator):
@@ -12,19 +11,15 @@ class SampleCountTableGenerator(BaseTableGenerator):
     def generate(self):
         zone_day_counts = defaultdict(lambda: defaultdict(int))
 
-        for row in self.data:
-            zone = row['zone_id']
-            day_eng = get_day_of_week(row['timestamp'])
-            day = super().DAY_MAPPING.get(day_eng, day_eng)
-            zone_day_counts[zone][day] += 1
+        for (zone, day, _, _), group in self.groups.items():
+            zone_day_counts[zone][day] += len(group['errors'])
 
         md = ["\n\n# 구역별 요일별 샘플 수\n"]
 
         headers = ['구역'] + super().DAYS + ['합계']
         rows = []
 
-        for zone in super().ALL_ZONES:
-            zone_name = super().ZONE_NAME_DICT.get(zone, f'구역 {zone}')
+        for zone, zone_name in super().ZONE_LABELS.items():
             row_data = [f"**{zone_name}**"]
             zone_total = 0
 
@@ -37,7 +32,7 @@ class SampleCountTableGenerator(BaseTableGenerator):
                     row_data.append("-")
 
             row_data.append(f"**{zone_total:,}**")
-            rows.append("| " + " | ".join(row_data) + " |")
+            rows.append(self._format_row(row_data))
 
         # Add total row
         total_row_data = ["**전체**"]
@@ -47,7 +42,7 @@ class SampleCountTableGenerator(BaseTableGenerator):
             total_row_data.append(f"**{day_total:,}**")
             grand_total += day_total
         total_row_data.append(f"**{grand_total:,}**")
-        rows.append("| " + " | ".join(total_row_data) + " |")
+        rows.append(self._format_row(total_row_data))
 
         md.extend(self._format_markdown_table(headers, rows))
         return "\n".join(md)
@@ -1,9 +1,8 @@
 #!/usr/bin/env python3
 """Summary statistics table generator"""
 
-from collections import defaultdict
 from .base import BaseTableGenerator
-from ..table_utils import get_day_of_week, categorize_queue_size, calculate_stats
+from ..table_utils import calculate_stats
 
 
 class SummaryStatisticsTableGenerator(BaseTableGenerator):
@@ -24,18 +23,14 @@ class SummaryStatisticsTableGenerator(BaseTableGenerator):
         return "\n".join(md)
 
     def _generate_zone_statistics(self):
-        zone_stats = defaultdict(list)
-        for row in self.data:
-            error_minutes = self._calculate_error_minutes(row)
-            zone_stats[row['zone_id']].append(error_minutes)
+        zone_stats = self._rollup(self.ZONE)
 
         md = ["\n## 구역별 통계\n"]
         md.append("| 구역 | 샘플 수 | 평균 오차 | 중간값 | 표준편차 | 조기 추정 | 지연 추정 |")
         md.append("|---|---|---|---|---|---|---|")
 
-        for zone in super().ALL_ZONES:
+        for zone, zone_name in super().ZONE_LABELS.items():
             errors = zone_stats.get(zone, [])
-            zone_name = super().ZONE_NAME_DICT.get(zone, f'구역 {zone}')
             if errors:
                 stats = calculate_stats(errors)
                 md.append(f"| {zone_name} | {stats['count']:,} | {stats['mean']:+.2f}분 | "
@@ -47,12 +42,7 @@ class SummaryStatisticsTableGenerator(BaseTableGenerator):
         return md
 
     def _generate_day_statistics(self):
-        day_stats = defaultdict(list)
-        for row in self.data:
-            error_minutes = self._calculate_error_minutes(row)
-            day_eng = get_day_of_week(row['timestamp'])
-            day = super().DAY_MAPPING.get(day_eng, day_eng)
-            day_stats[day].append(error_minutes)
+        day_stats = self._rollup(self.DAY)
 
         md = ["\n## 요일별 통계\n"]
         md.append("| 요일 | 샘플 수 | 평균 오차 | 중간값 | 표준편차 | 조기 추정 | 지연 추정 |")
@@ -69,11 +59,7 @@ class SummaryStatisticsTableGenerator(BaseTableGenerator):
         return md
 
     def _generate_queue_statistics(self):
-        queue_stats = defaultdict(list)
-        for row in self.data:
-            error_minutes = self._calculate_error_minutes(row)
-            queue_cat = categorize_queue_size(row['objectCount'])
-            queue_stats[queue_cat].append(error_minutes)
+        queue_stats = self._rollup(self.QUEUE)
 
         md = ["\n## 대기인원별 통계\n"]
         md.append("| 대기인원 | 샘플 수 | 평균 오차 | 중간값 | 표준편차 | 조기 추정 | 지연 추정 |")
@@ -3,55 +3,37 @@
 
 import statistics
 from itertools import chain
-from collections import defaultdict
 from .base import BaseTableGenerator
-from ...utils.congestion_utils import get_congestion_level, get_congestion_bins, get_congestion_ranges_for_all_groups
+from ...utils.congestion_utils import get_congestion_bins, get_congestion_ranges_for_all_groups
 
 
 class ZoneByCongestionTableGenerator(BaseTableGenerator):
     """Generate average error by zone and congestion level table"""
     CONGESTION_KR_DICT = {'Low': '원활', 'Medium': '보통', 'High': '혼잡', 'Very High': '매우혼잡'}
-    def __init__(self, data):
-        super().__init__(data)
+    def __init__(self, data, groups=None):
+        super().__init__(data, groups)
+        # Resolved once and shared by every section of the report
+        self.congestion_levels = get_congestion_bins()
 
     def generate(self):
         """Generate complete zone by congestion analysis"""
         # Aggregate data
-        zone_congestion_errors, zone_congestion_counts, zone_congestion_predicted, zone_congestion_actual = self._aggregate_data()
+        zone_congestion_groups = self._rollup_groups(self.ZONE, self.CONGESTION)
 
         # Build report sections
         md = ["# 구역별 혼잡도별 분석\n"]
         md.extend(self._generate_congestion_definition_section())
-        md.extend(self._generate_error_table(zone_congestion_errors, zone_congestion_counts))
-        md.extend(self._generate_wait_time_table(zone_congestion_predicted, zone_congestion_actual))
+        md.extend(self._generate_error_table(zone_congestion_groups))
+        md.extend(self._generate_wait_time_table(zone_congestion_groups))
 
         return "\n".join(md)
 
-    def _aggregate_data(self):
-        """Aggregate data by zone and congestion level"""
-        zone_congestion_errors = defaultdict(lambda: defaultdict(list))
-        zone_congestion_counts = defaultdict(lambda: defaultdict(int))
-        zone_congestion_predicted = defaultdict(lambda: defaultdict(list))
-        zone_congestion_actual = defaultdict(lambda: defaultdict(list))
-
-        for row in self.data:
-            zone = row['zone_id']
-            congestion = get_congestion_level(row)
-            error_minutes = self._calculate_error_minutes(row)
-
-            zone_congestion_errors[zone][congestion].append(error_minutes)
-            zone_congestion_counts[zone][congestion] += 1
-            zone_congestion_predicted[zone][congestion].append(row['finalEstTime'])
-            zone_congestion_actual[zone][congestion].append(row['actualPassTime'])
-
-        return zone_congestion_errors, zone_congestion_counts, zone_congestion_predicted, zone_congestion_actual
-
     def _generate_congestion_definition_section(self):
         """Generate congestion level definition section"""
         md = []
         md.append("## 혼잡도 정의\n")
 
-        congestion_levels = get_congestion_bins()
+        congestion_levels = self.congestion_levels
         ranges = get_congestion_ranges_for_all_groups()
 
         md.append("### 신분확인 구역 (1-3)\n")
@@ -64,138 +46,96 @@ class ZoneByCongestionTableGenerator(BaseTableGenerator):
 
         return md
 
-    def _generate_error_table(self, zone_congestion_errors, zone_congestion_counts):
+    def _generate_error_table(self, zone_congestion_groups):
         """Generate zone by congestion error table"""
         md = []
         md.append("\n## 1. 구역별 혼잡도별 평균 오차\n")
         md.append("**평균 오차 (분)** | +: 과대추정, -: 과소추정\n")
 
-        congestion_levels = get_congestion_bins()
+        congestion_levels = self.congestion_levels
         headers = ['구역'] + [self.CONGESTION_KR_DICT[level] for level in congestion_levels] + ['평균']
         rows = []
 
-        for zone in super().ALL_ZONES:
-            zone_name = super().ZONE_NAME_DICT.get(zone, f'구역 {zone}')
-            row_data = [f"**{zone_name}**"]
-            zone_all_errors = []
-
-            for level in congestion_levels:
-                errors = zone_congestion_errors[zone][level]
-                if errors:
-                    avg = statistics.mean(errors)
-                    count = zone_congestion_counts[zone][level]
-                    row_data.append(f"{avg:+.2f} ({count:,})")
-                    zone_all_errors.extend(errors)
-                else:
-                    row_data.append("-")
-
-            if zone_all_errors:
-                zone_avg = statistics.mean(zone_all_errors)
-                row_data.append(f"**{zone_avg:+.2f}**")
-            else:
-                row_data.append("-")
-
-            rows.append("| " + " | ".join(row_data) + " |")
+        for zone, zone_name in super().ZONE_LABELS.items():
+            rows.append(self._format_error_row(zone_name, zone_congestion_groups[zone], congestion_levels, with_count=True))
 
         # Add overall averages row
         rows.append("|---|" + "---|" * (len(congestion_levels) + 1))
         overall_row = ["**전체**"]
 
+        # Column and grand totals reuse the cell group lists instead of re-chaining every value
         for level in congestion_levels:
-            all_errors = list(chain(*(zone_congestion_errors[z][level] for z in super().ALL_ZONES)))
-            if all_errors:
-                avg = statistics.mean(all_errors)
-                total_count = sum(zone_congestion_counts[z][level] for z in super().ALL_ZONES)
+            level_groups = [group for z in super().ALL_ZONES for group in zone_congestion_groups[z][level]]
+            if level_groups:
+                avg = self._mean_error(level_groups)
+                total_count = self._count(level_groups)
                 overall_row.append(f"**{avg:+.2f}** ({total_count:,})")
             else:
                 overall_row.append("-")
 
-        all_errors = list(chain(*(chain(*d.values()) for d in zone_congestion_errors.values())))
-        if all_errors:
-            overall_avg = statistics.mean(all_errors)
+        if self.groups:
+            overall_avg = self._mean_error(self.groups.values())
             overall_row.append(f"**{overall_avg:+.2f}**")
         else:
             overall_row.append("-")
 
-        rows.append("| " + " | ".join(overall_row) + " |")
+        rows.append(self._format_row(overall_row))
 
         md.extend(self._format_markdown_table(headers, rows[:-2]))
         md.extend(rows[-2:])
 
         return md
 
-    def _generate_wait_time_table(self, zone_congestion_predicted, zone_congestion_actual):
+    def _generate_wait_time_table(self, zone_congestion_groups):
         """Generate predicted vs actual wait time comparison table"""
         md = []
         md.append("\n\n## 2. 평균 대기시간 비교\n")
         md.append("**형식:** 예측값 / 실제값 (min~max) (분) - finalEstTime vs actualPassTime\n")
 
-        congestion_levels = get_congestion_bins()
+        congestion_levels = self.congestion_levels
         headers = ['구역'] + [self.CONGESTION_KR_DICT[level] for level in congestion_levels] + ['평균']
         wait_time_rows = []
 
-        for zone in super().ALL_ZONES:
-            zone_name = super().ZONE_NAME_DICT.get(zone, f'구역 {zone}')
+        # Cells, row, column and grand totals all read the shared groups; no wait-time values are copied
+        for zone, zone_name in super().ZONE_LABELS.items():
             row_data = [f"**{zone_name}**"]
+            congestion_groups = zone_congestion_groups[zone]
 
             for level in congestion_levels:
-                predicted = zone_congestion_predicted[zone][level]
-                actual = zone_congestion_actual[zone][level]
-
-                if predicted and actual:
-                    avg_pred = statistics.mean(predicted) / 60
-                    avg_actual = statistics.mean(actual) / 60
-                    min_actual = min(actual) / 60
-                    max_actual = max(actual) / 60
-                    row_data.append(f"{avg_pred:.1f} / {avg_actual:.1f} ({min_actual:.1f}~{max_actual:.1f})")
-                else:
-                    row_data.append("-")
+                row_data.append(self._format_wait_stats(congestion_groups[level]))
 
             # Overall average for the zone
-            zone_all_predicted = list(chain(*zone_congestion_predicted[zone].values()))
-            zone_all_actual = list(chain(*zone_congestion_actual[zone].values()))
-            if zone_all_predicted and zone_all_actual:
-                avg_pred = statistics.mean(zone_all_predicted) / 60
-                avg_actual = statistics.mean(zone_all_actual) / 60
-                min_actual = min(zone_all_actual) / 60
-                max_actual = max(zone_all_actual) / 60
-                row_data.append(f"**{avg_pred:.1f} / {avg_actual:.1f} ({min_actual:.1f}~{max_actual:.1f})**")
-            else:
-                row_data.append("-")
+            zone_groups = [group for groups in congestion_groups.values() for group in groups]
+            row_data.append(self._format_wait_stats(zone_groups, bold=True))
 
-            wait_time_rows.append("| " + " | ".join(row_data) + " |")
+            wait_time_rows.append(self._format_row(row_data))
 
         # Add overall averages row
         wait_time_rows.append("|---|" + "---|" * (len(congestion_levels) + 1))
         overall_row = ["**전체**"]
 
         for level in congestion_levels:
-            all_predicted = list(chain(*(zone_congestion_predicted[z][level] for z in super().ALL_ZONES)))
-            all_actual = list(chain(*(zone_congestion_actual[z][level] for z in super().ALL_ZONES)))
-            if all_predicted and all_actual:
-                avg_pred = statistics.mean(all_predicted) / 60
-                avg_actual = statistics.mean(all_actual) / 60
-                min_actual = min(all_actual) / 60
-                max_actual = max(all_actual) / 60
-                overall_row.append(f"**{avg_pred:.1f} / {avg_actual:.1f} ({min_actual:.1f}~{max_actual:.1f})**")
-            else:
-                overall_row.append("-")
+            level_groups = [group for z in super().ALL_ZONES for group in zone_congestion_groups[z][level]]
+            overall_row.append(self._format_wait_stats(level_groups, bold=True))
 
         # Grand overall
-        grand_predicted = list(chain(*(chain(*d.values()) for d in zone_congestion_predicted.values())))
-        grand_actual = list(chain(*(chain(*d.values()) for d in zone_congestion_actual.values())))
-        if grand_predicted and grand_actual:
-            avg_pred = statistics.mean(grand_predicted) / 60
-            avg_actual = statistics.mean(grand_actual) / 60
-            min_actual = min(grand_actual) / 60
-            max_actual = max(grand_actual) / 60
-            overall_row.append(f"**{avg_pred:.1f} / {avg_actual:.1f} ({min_actual:.1f}~{max_actual:.1f})**")
-        else:
-            overall_row.append("-")
+        overall_row.append(self._format_wait_stats(list(self.groups.values()), bold=True))
 
-        wait_time_rows.append("| " + " | ".join(overall_row) + " |")
+        wait_time_rows.append(self._format_row(overall_row))
 
         md.extend(self._format_markdown_table(headers, wait_time_rows[:-2]))
         md.extend(wait_time_rows[-2:])
 
-        return md
\ No newline at end of file
+        return md
+
+    def _format_wait_stats(self, groups, bold=False):
+        """Format the wait times of several groups as 'predicted / actual (min~max)' in minutes, '-' if empty"""
+        if not groups:
+            return "-"
+
+        avg_pred = statistics.mean(chain.from_iterable(group['predicted'] for group in groups)) / 60
+        avg_actual = sum(group['actual_sum'] for group in groups) / self._count(groups) / 60
+        min_actual = min(group['actual_min'] for group in groups) / 60
+        max_actual = max(group['actual_max'] for group in groups) / 60
+        cell = f"{avg_pred:.1f} / {avg_actual:.1f} ({min_actual:.1f}~{max_actual:.1f})"
+        return f"**{cell}**" if bold else cell
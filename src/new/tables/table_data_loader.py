@@ -3,9 +3,11 @@
 Data loader for table generation, using the core data loader and outlier filtering.
 """
 
-from src.new.core.data_loader import load_all_logs, filter_outliers
+from itertools import chain
 
-def load_and_process_data(data_dir="csv", format_hint=None, from_date=None, to_date=None):
+from src.new.core.data_loader import iter_logs, filter_outliers
+
+def load_and_process_data(data_dir="csv", format_hint=None, from_date=None, to_date=None, workers=1):
     """
     Loads and processes log data from a given directory using the core data loader.
 
@@ -19,6 +21,8 @@ def load_and_process_data(data_dir="csv", format_hint=None, from_date=None, to_d
                                      Defaults to None for auto-detection.
         from_date (str, optional): Start date filter in YYYYMMDD format (inclusive).
         to_date (str, optional): End date filter in YYYYMMDD format (inclusive).
+        workers (int, optional): Number of CSV parser processes, None for os.cpu_count().
+                                 Defaults to 1 (sequential).
 
     Returns:
         tuple: (filtered_data, outlier_stats) where filtered_data is a list of cleaned records
@@ -26,15 +30,17 @@ def load_and_process_data(data_dir="csv", format_hint=None, from_date=None, to_d
     """
     print(f"--- Loading and processing data from '{data_dir}' ---")
 
-    # Load all log files using the core data loader
-    raw_data = load_all_logs(log_dir=data_dir, format_hint=format_hint, from_date=from_date, to_date=to_date)
+    # Stream log records straight into the outlier filter so the unfiltered
+    # dataset is never materialized as one list
+    raw_data = iter_logs(log_dir=data_dir, format_hint=format_hint, from_date=from_date, to_date=to_date, workers=workers)
 
-    if not raw_data:
+    # Peek the first record so an empty load returns before the filter prints its summary
+    if (first_record := next(raw_data, None)) is None:
         print("Warning: No data was loaded. Please check the log directory and file formats.")
         return [], {}
 
     # Filter outliers using the core outlier detection function
-    filtered_data, outlier_stats = filter_outliers(raw_data)
+    filtered_data, outlier_stats = filter_outliers(chain((first_record,), raw_data))
 
     if not filtered_data:
         print("Warning: All data was filtered out as outliers.")
@@ -2,6 +2,7 @@
 """Table generator module for queue analysis - backward compatible API"""
 
 from .generators import (
+    BaseTableGenerator,
     ZoneByDayTableGenerator,
     ZoneByQueueTableGenerator,
     ZoneByCongestionTableGenerator,
@@ -12,32 +13,38 @@ from .generators import (
 
 
 # Public API - backward compatible function interfaces
-def generate_zone_by_day_table(data):
+# Pass groups=aggregate_table_data(data) to share one scan of data across tables
+def aggregate_table_data(data):
+    """Group data once by zone, day, queue size and congestion for all table generators"""
+    return BaseTableGenerator.aggregate(data)
+
+
+def generate_zone_by_day_table(data, groups=None):
     """Generate average error by zone and day of week table"""
-    return ZoneByDayTableGenerator(data).generate()
+    return ZoneByDayTableGenerator(data, groups).generate()
 
 
-def generate_zone_by_queue_table(data):
+def generate_zone_by_queue_table(data, groups=None):
     """Generate average error by zone and queue size table"""
-    return ZoneByQueueTableGenerator(data).generate()
+    return ZoneByQueueTableGenerator(data, groups).generate()
 
 
-def generate_zone_by_congestion_table(data):
+def generate_zone_by_congestion_table(data, groups=None):
     """Generate average error by zone and congestion level table"""
-    return ZoneByCongestionTableGenerator(data).generate()
+    return ZoneByCongestionTableGenerator(data, groups).generate()
 
 
-def generate_queue_by_day_table(data):
+def generate_queue_by_day_table(data, groups=None):
     """Generate average error by queue size and day of week table"""
-    return QueueByDayTableGenerator(data).generate()
+    return QueueByDayTableGenerator(data, groups).generate()
 
 
-def generate_sample_count_table(data):
+def generate_sample_count_table(data, groups=None):
     """Generate sample count by zone and day of week table"""
-    return SampleCountTableGenerator(data).generate()
+    return SampleCountTableGenerator(data, groups).generate()
 
 
-def generate_summary_statistics_table(data):
+def generate_summary_statistics_table(data, groups=None):
     """Generate comprehensive summary statistics by multiple dimensions"""
-    return SummaryStatisticsTableGenerator(data).generate()
+    return SummaryStatisticsTableGenerator(data, groups).generate()
 
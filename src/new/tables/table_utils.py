@@ -2,7 +2,29 @@
 """Utility functions for table generation"""
 
 import statistics
+from bisect import bisect_left, bisect_right
 from datetime import datetime
+from functools import lru_cache
+
+
+# English day names, indexed by datetime.weekday()
+_DAYS_ENGLISH = ('Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun')
+
+
+@lru_cache(maxsize=4096)
+def _weekday_of(date_str):
+    """Weekday index of a YYYY-MM-DD date token (memoized: logs span few distinct days)"""
+    return datetime.strptime(date_str, '%Y-%m-%d').weekday()
+
+
+@lru_cache(maxsize=86400)
+def _is_clock_time(time_str):
+    """Whether an HH:MM:SS time token parses (memoized: at most one entry per second of the day)"""
+    try:
+        datetime.strptime(time_str, '%H:%M:%S')
+    except ValueError:
+        return False
+    return True
 
 
 def get_day_of_week(timestamp_str):
@@ -10,16 +32,23 @@ def get_day_of_week(timestamp_str):
     Get the day of the week from a timestamp string.
     """
     try:
-        # Parse the timestamp string
-        timestamp = datetime.strptime(timestamp_str, '%Y-%m-%d %H:%M:%S')
-        # English day names
-        days_english = ['Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun']
-        return days_english[timestamp.weekday()]
+        # A valid time token means the weekday depends only on the date token, parsed once per date
+        date_part, _, time_part = timestamp_str.partition(' ')
+        if _is_clock_time(time_part):
+            return _DAYS_ENGLISH[_weekday_of(date_part)]
+    except (AttributeError, ValueError):
+        pass
+
+    try:
+        # Anything the token path does not accept gets the full '%Y-%m-%d %H:%M:%S' parse
+        return _DAYS_ENGLISH[datetime.strptime(timestamp_str, '%Y-%m-%d %H:%M:%S').weekday()]
     except (ValueError, TypeError):
         return "Invalid Day"
 
 
+@lru_cache(maxsize=4096)
 def categorize_queue_size(count):
+    """50-person bucket label of a queue size (memoized: object counts repeat heavily)"""
     if count <= 0:
         return "0"
 
@@ -38,11 +67,16 @@ def calculate_stats(errors):
             'early_count': 0, 'late_count': 0
         }
 
+    # One sort serves the median and both sign counts (zero errors count as neither)
+    sorted_errors = sorted(errors)
+    n = len(sorted_errors)
+    mid = n // 2
+
     return {
-        'count': len(errors),
-        'mean': statistics.mean(errors),
-        'median': statistics.median(errors),
-        'std': statistics.stdev(errors) if len(errors) > 1 else 0,
-        'early_count': sum(1 for e in errors if e < 0),
-        'late_count': sum(1 for e in errors if e > 0),
+        'count': n,
+        'mean': statistics.mean(sorted_errors),
+        'median': sorted_errors[mid] if n % 2 else (sorted_errors[mid - 1] + sorted_errors[mid]) / 2,
+        'std': statistics.stdev(sorted_errors) if n > 1 else 0,
+        'early_count': bisect_left(sorted_errors, 0),
+        'late_count': n - bisect_right(sorted_errors, 0),
     }
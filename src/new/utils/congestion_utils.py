@@ -1,41 +1,64 @@
 #!/usr/bin/env python3
 """Congestion level calculation utilities - format-agnostic"""
+
+import sys
+from bisect import bisect_left
+from functools import lru_cache
+
 congestion_level_table = {
-    "identity": [40, 80, 140],
-    'security': [5, 11, 16]
+    "identity": (40, 80, 140),
+    'security': (5, 11, 16)
+}
+
+# Threshold tuples resolved once, so classifying a record needs no table lookups
+_IDENTITY_THRESHOLDS = congestion_level_table['identity']
+_SECURITY_THRESHOLDS = congestion_level_table['security']
+# Interned so every record, group key and table lookup shares one object per level
+# ('Very High' is not an identifier-like literal, so it would not be interned automatically)
+_CONGESTION_BINS = tuple(map(sys.intern, ('Low', 'Medium', 'High', 'Very High')))
+
+
+def _build_congestion_ranges(thresholds):
+    """Human-readable object count range per congestion level for one zone group's thresholds"""
+    low, medium, high = thresholds
+    return {
+        'Low': f'0-{low} people',
+        'Medium': f'{low+1}-{medium} people',
+        'High': f'{medium+1}-{high} people',
+        'Very High': f'{high+1}+ people'
+    }
+
+
+# The range strings only depend on the static thresholds: build them once at import
+_CONGESTION_RANGES = {
+    'identity': _build_congestion_ranges(_IDENTITY_THRESHOLDS),
+    'security': _build_congestion_ranges(_SECURITY_THRESHOLDS),
 }
 
-def get_congestion_level(record):
-    zone_id = record.get('zone_id')
-    object_count = record.get('objectCount', 0)
 
-    zone_group = 'identity' if zone_id < 4 else 'security'
-    congestion_level = congestion_level_table.get(zone_group)
+@lru_cache(maxsize=4096)
+def _congestion_level(zone_id, object_count):
+    """Congestion level of a (zone_id, objectCount) pair - memoized, the input space is tiny"""
+    low, medium, high = _IDENTITY_THRESHOLDS if zone_id < 4 else _SECURITY_THRESHOLDS
+
+    return _CONGESTION_BINS[0 if object_count <= low else 1 if object_count <= medium else 2 if object_count <= high else 3]
 
 
-    if object_count <= congestion_level[0]:
-        return 'Low'
-    elif object_count <= congestion_level[1]:
-        return 'Medium'
-    elif object_count <= congestion_level[2]:
-        return 'High'
-    else:
-        return 'Very High'
+# Called once per record: the cached classifier is bound as a default (a local, not a global lookup)
+def get_congestion_level(record, _level_of=_congestion_level):
+    return _level_of(record.get('zone_id'), record.get('objectCount', 0))
 
 
 def get_congestion_bins():
-    return ['Low', 'Medium', 'High', 'Very High']
+    return list(_CONGESTION_BINS)
+
+
+# Inclusive upper edges of the object-count bins (the last bin is open-ended)
+_OBJECT_COUNT_EDGES = (10, 30, 50)
 
 
 def categorize_object_count(count):
-    if count <= 10:
-        return 'Low'
-    elif count <= 30:
-        return 'Medium'
-    elif count <= 50:
-        return 'High'
-    else:
-        return 'Very High'
+    return _CONGESTION_BINS[bisect_left(_OBJECT_COUNT_EDGES, count)]
 
 
 def get_congestion_range(level, zone_group='identity'):
@@ -49,23 +72,9 @@ def get_congestion_range(level, zone_group='identity'):
     Returns:
         str: Human-readable range description
     """
-    thresholds = congestion_level_table.get(zone_group, congestion_level_table['identity'])
-
-    ranges = {
-        'Low': f'0-{thresholds[0]} people',
-        'Medium': f'{thresholds[0]+1}-{thresholds[1]} people',
-        'High': f'{thresholds[1]+1}-{thresholds[2]} people',
-        'Very High': f'{thresholds[2]+1}+ people'
-    }
-    return ranges.get(level, 'Unknown')
+    return _CONGESTION_RANGES.get(zone_group, _CONGESTION_RANGES['identity']).get(level, 'Unknown')
 
 
 def get_congestion_ranges_for_all_groups():
-    """Get congestion ranges for both zone groups"""
-    identity_ranges = {level: get_congestion_range(level, 'identity') for level in get_congestion_bins()}
-    security_ranges = {level: get_congestion_range(level, 'security') for level in get_congestion_bins()}
-
-    return {
-        'identity': identity_ranges,
-        'security': security_ranges
-    }
+    """Get congestion ranges for both zone groups (a fresh copy, so callers cannot alter the shared table)"""
+    return {zone_group: dict(ranges) for zone_group, ranges in _CONGESTION_RANGES.items()}
@@ -1,8 +1,11 @@
 #!/usr/bin/env python3
 """이상치 탐지 모듈 - Outlier detection using IQR method and adaptive zone-congestion filtering"""
 
-import statistics
+import sys
+import warnings
 from collections import defaultdict
+from typing import NamedTuple, Optional
+from .congestion_utils import get_congestion_bins
 from .statistics_utils import calculate_quartiles
 
 
@@ -24,9 +27,21 @@ ZONE_CONGESTION_BOUNDS = {
     }
 }
 
+# Flattened {(zone_group, congestion_level): (lower, upper)} so a bounds check is a single lookup
+# (levels interned to match the objects records carry from get_congestion_level)
+_HARD_BOUNDS = {
+    (zone_group, sys.intern(level)): bounds
+    for zone_group, level_bounds in ZONE_CONGESTION_BOUNDS.items()
+    for level, bounds in level_bounds.items()
+}
+
 
-@DeprecationWarning
 def detect_outliers_iqr(values, multiplier=1.5):
+    warnings.warn(
+        "detect_outliers_iqr is deprecated; use filter_outliers (zone-congestion bounds) instead",
+        DeprecationWarning,
+        stacklevel=2,
+    )
     q1, q2, q3 = calculate_quartiles(values)
     if q1 is None:
         return set()
@@ -52,7 +67,7 @@ def get_zone_group(zone_id):
     return 'identity' if zone_id <= 4 else 'security'
 
 
-def check_hard_bounds(record):
+def check_hard_bounds(record, _bounds=_HARD_BOUNDS, _zone_group=get_zone_group):
     """
     Check if record passes hard-coded zone-congestion bounds
 
@@ -61,24 +76,35 @@ def check_hard_bounds(record):
 
     Returns:
         bool: True if within bounds, False otherwise
+
+    The lookup table and zone grouping are bound as defaults so this per-record
+    check reads locals instead of module globals.
     """
     zone_id = record.get('zone_id')
-    congestion_level = record.get('congestion_level')
     actual_time = record.get('actualPassTime')
 
-    if zone_id is None or congestion_level is None or actual_time is None:
+    if zone_id is None or actual_time is None:
         return False
 
-    zone_group = get_zone_group(zone_id)
-    bounds = ZONE_CONGESTION_BOUNDS.get(zone_group, {}).get(congestion_level)
-
-    if bounds is None:
+    # A missing or unknown congestion level has no bounds entry
+    if (bounds := _bounds.get((_zone_group(zone_id), record.get('congestion_level')))) is None:
         return False
 
     lower, upper = bounds
     return lower < actual_time < upper
 
 
+class GroupStat(NamedTuple):
+    """actualPassTime statistics and adaptive bounds of one (zone, congestion) group"""
+    avg_pass_time: float
+    sample_count: int
+    skip_adaptive_filter: bool
+    min_time: int
+    max_time: int
+    lower_bound: Optional[float] = None  # None when the group is too small for adaptive filtering
+    upper_bound: Optional[float] = None
+
+
 def compute_group_statistics(data, min_sample_threshold, lower_mult, upper_mult):
     """
     Compute statistical bounds for each (zone, congestion) group
@@ -90,48 +116,56 @@ def compute_group_statistics(data, min_sample_threshold, lower_mult, upper_mult)
         upper_mult: Upper bound multiplier (e.g., 1.7)
 
     Returns:
-        dict: Group statistics keyed by (zone_id, congestion_level)
+        dict: GroupStat keyed by (zone_id, congestion_level)
     """
-    # Group actualPassTime values by (zone, congestion)
-    group_data = defaultdict(list)
+    # Reduce actualPassTime per (zone, congestion) in a single pass: [sum, count, min, max]
+    group_totals = {}
     for row in data:
         if 'zone_id' in row and 'congestion_level' in row and 'actualPassTime' in row:
             key = (row['zone_id'], row['congestion_level'])
-            group_data[key].append(row['actualPassTime'])
+            time = row['actualPassTime']
+            if (totals := group_totals.get(key)) is None:
+                group_totals[key] = [time, 1, time, time]
+            else:
+                totals[0] += time
+                totals[1] += 1
+                if time < totals[2]:
+                    totals[2] = time
+                elif time > totals[3]:
+                    totals[3] = time
 
     # Calculate statistics using dictionary comprehension with walrus operator
     group_stats = {
-        key: {
-            'avg_pass_time': (avg := statistics.mean(times)),
-            'sample_count': (count := len(times)),
-            'skip_adaptive_filter': count < min_sample_threshold,
-            'min_time': min(times),
-            'max_time': max(times),
+        key: GroupStat(
+            avg_pass_time=(avg := total / count),
+            sample_count=count,
+            skip_adaptive_filter=count < min_sample_threshold,
+            min_time=min_time,
+            max_time=max_time,
             **({'lower_bound': avg * lower_mult, 'upper_bound': avg * upper_mult}
                if count >= min_sample_threshold else {})
-        }
-        for key, times in group_data.items() if times
+        )
+        for key, (total, count, min_time, max_time) in group_totals.items()
     }
 
     return group_stats
 
 
-def build_outlier_statistics(original_data, filtered_data, group_stats, tracking, config):
+def build_outlier_statistics(total_count, filtered_data, group_stats, tracking, config):
     """
     Build comprehensive outlier statistics dictionary
 
     Args:
-        original_data: Original unfiltered data
+        total_count: Number of records in the original unfiltered data
         filtered_data: Data after filtering
-        group_stats: Group statistics dictionary
-        tracking: Tracking dictionary with removal reasons
+        group_stats: GroupStat per group key, from compute_group_statistics
+        tracking: Per-outcome Counters of records keyed by (zone_id, congestion_level)
         config: Configuration parameters dict
 
     Returns:
         dict: Comprehensive outlier statistics
     """
-    total_count = len(original_data)
-    removed_count = len(original_data) - len(filtered_data)
+    removed_count = total_count - len(filtered_data)
     removal_rate = (removed_count / total_count * 100) if total_count > 0 else 0
 
     # Build per-group statistics
@@ -143,42 +177,38 @@ def build_outlier_statistics(original_data, filtered_data, group_stats, tracking
         'skipped_adaptive': 0
     })
 
-    # Count removals per group
-    for record in tracking.get('removed_by_hard_bounds_stage1', []):
-        key = (record['zone_id'], record['congestion_level'])
-        group_removal_stats[key]['removed_by_hard_bounds_stage1'] += 1
-        group_removal_stats[key]['total_in_group'] += 1
-
-    for record in tracking['removed_by_adaptive']:
-        key = (record['zone_id'], record['congestion_level'])
-        group_removal_stats[key]['removed_adaptive'] += 1
-        group_removal_stats[key]['total_in_group'] += 1
-
-    for record in tracking['kept_records']:
-        key = (record['zone_id'], record['congestion_level'])
-        group_removal_stats[key]['kept'] += 1
-        group_removal_stats[key]['total_in_group'] += 1
-
-    for record in tracking['skipped_adaptive_groups']:
-        key = (record['zone_id'], record['congestion_level'])
-        group_removal_stats[key]['skipped_adaptive'] += 1
-        group_removal_stats[key]['total_in_group'] += 1
+    # Fold per-outcome counts into per-group statistics
+    for tracking_key, stat_key in (('removed_by_hard_bounds_stage1', 'removed_by_hard_bounds_stage1'),
+                                   ('removed_by_adaptive', 'removed_adaptive'),
+                                   ('kept_records', 'kept'),
+                                   ('skipped_adaptive_groups', 'skipped_adaptive')):
+        for key, count in tracking.get(tracking_key, {}).items():
+            group_removal_stats[key][stat_key] += count
+            group_removal_stats[key]['total_in_group'] += count
 
     # Merge with group_stats
     detailed_group_stats = {
         key: {
             **group_removal_stats[key],
-            'avg_pass_time': group_stats[key]['avg_pass_time'],
-            'sample_count': group_stats[key]['sample_count'],
+            'avg_pass_time': stats.avg_pass_time,
+            'sample_count': stats.sample_count,
             'bounds': {
-                'lower': group_stats[key].get('lower_bound'),
-                'upper': group_stats[key].get('upper_bound')
-            } if not group_stats[key]['skip_adaptive_filter'] else None,
-            'skipped_group': group_stats[key]['skip_adaptive_filter']
+                'lower': stats.lower_bound,
+                'upper': stats.upper_bound
+            } if not stats.skip_adaptive_filter else None,
+            'skipped_group': stats.skip_adaptive_filter
         }
-        for key in group_stats
+        for key, stats in group_stats.items()
     }
 
+    # Per-congestion [kept, removed_stage1, removed_adaptive] totals, computed once for all reports
+    per_congestion = {level: [0, 0, 0] for level in get_congestion_bins()}
+    for (_, congestion_level), stats in detailed_group_stats.items():
+        if (counts := per_congestion.get(congestion_level)) is not None:
+            counts[0] += stats['kept']
+            counts[1] += stats['removed_by_hard_bounds_stage1']
+            counts[2] += stats['removed_adaptive']
+
     return {
         # Backward compatible fields
         'total_records': total_count,
@@ -188,11 +218,12 @@ def build_outlier_statistics(original_data, filtered_data, group_stats, tracking
 
         # New fields
         'removal_breakdown': {
-            'removed_by_hard_bounds_stage1': len(tracking.get('removed_by_hard_bounds_stage1', [])),
-            'removed_by_adaptive': len(tracking['removed_by_adaptive']),
-            'skipped_groups_count': len(tracking['skipped_adaptive_groups']),
+            'removed_by_hard_bounds_stage1': sum(tracking.get('removed_by_hard_bounds_stage1', {}).values()),
+            'removed_by_adaptive': sum(tracking['removed_by_adaptive'].values()),
+            'skipped_groups_count': sum(tracking['skipped_adaptive_groups'].values()),
         },
         'group_statistics': detailed_group_stats,
+        'per_congestion': per_congestion,
         'config': config
     }
 
@@ -227,19 +258,9 @@ def print_filter_summary(outlier_stats):
     print(f"    스킵된 그룹 (< {outlier_stats['config']['min_sample_threshold']} samples): {skipped_group_count}")
 
     # Print congestion level breakdown
-    from collections import defaultdict
-    congestion_stats = defaultdict(lambda: {'kept': 0, 'removed_stage1': 0, 'removed_adaptive': 0})
-
-    for (zone_id, congestion_level), stats in group_stats.items():
-        congestion_stats[congestion_level]['kept'] += stats.get('kept', 0)
-        congestion_stats[congestion_level]['removed_stage1'] += stats.get('removed_by_hard_bounds_stage1', 0)
-        congestion_stats[congestion_level]['removed_adaptive'] += stats.get('removed_adaptive', 0)
-
     print(f"\n  혼잡도별 통계:")
-    for congestion_level in ['Low', 'Medium', 'High', 'Very High']:
-        stats = congestion_stats.get(congestion_level, {'kept': 0, 'removed_stage1': 0, 'removed_adaptive': 0})
-        total_cong = stats['kept'] + stats['removed_stage1'] + stats['removed_adaptive']
-        if total_cong > 0:
-            kept_pct = (stats['kept'] / total_cong * 100)
-            print(f"    {congestion_level:12s}: 유지 {stats['kept']:6,}건 ({kept_pct:5.1f}%) | "
-                  f"Stage1 제거 {stats['removed_stage1']:5,}건 | Stage2 제거 {stats['removed_adaptive']:5,}건")
\ No newline at end of file
+    for congestion_level, (kept, removed_stage1, removed_adaptive) in outlier_stats['per_congestion'].items():
+        if (total_cong := kept + removed_stage1 + removed_adaptive) > 0:
+            kept_pct = (kept / total_cong * 100)
+            print(f"    {congestion_level:12s}: 유지 {kept:6,}건 ({kept_pct:5.1f}%) | "
+                  f"Stage1 제거 {removed_stage1:5,}건 | Stage2 제거 {removed_adaptive:5,}건")
\ No newline at end of file
@@ -11,17 +11,19 @@ def calculate_quartiles(values):
     sorted_vals = sorted(values)
     n = len(sorted_vals)
 
-    def _get_median(arr):
-        m = len(arr)
+    # Median of sorted_vals[start:stop] read by index, so the halves are never copied
+    def _get_median(start, stop):
+        m = stop - start
         if m == 0:
             return 0
+        mid = start + m//2
         if m % 2 == 0:
-            return (arr[m//2 - 1] + arr[m//2]) / 2
-        return arr[m//2]
+            return (sorted_vals[mid - 1] + sorted_vals[mid]) / 2
+        return sorted_vals[mid]
 
-    q2_median = _get_median(sorted_vals)
-    q1_lower_quartile = _get_median(sorted_vals[:n//2])
-    q3_upper_quartile = _get_median(sorted_vals[(n+1)//2:])
+    q2_median = _get_median(0, n)
+    q1_lower_quartile = _get_median(0, n//2)
+    q3_upper_quartile = _get_median((n+1)//2, n)
 
     return q1_lower_quartile, q2_median, q3_upper_quartile
 